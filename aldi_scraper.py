@@ -14,10 +14,17 @@ import argparse
 import logging
 import hashlib
 import json
-from datetime import datetime
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from html.parser import HTMLParser
 from urllib.parse import urljoin, parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from playwright.async_api import async_playwright
 
 # Logging konfigurieren
@@ -28,13 +35,294 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Vorkompilierte reguläre Ausdrücke
+_SANITIZE_RE = re.compile(r'[^\w\-_\. ]')
+_CD_FILENAME_RE = re.compile(r'filename\*?=(?:UTF-8\'\'|")?([^"]+)')
+_PDF_SUFFIX_RE = re.compile(r'\.pdf$')
+_YEAR_TAIL_RE = re.compile(r'\d{2,4}$')
+_URL_PDF_RE = re.compile(r'([^/]+)\.pdf')
+_KW_RE = re.compile(r'kw(\d+)')
+_KW_INLINE_RE = re.compile(r'kw[-_]?(\d+)')
+_KW_LOOSE_RE = re.compile(r'kw[^0-9]*(\d+)')
+_JAHR_RE = re.compile(r'20(\d{2})')
+# ETags, die wie ein Inhalts-Hash aussehen (MD5 bis SHA-256, bei S3-Multipart-Uploads mit Teilanzahl)
+_CONTENT_ETAG_RE = re.compile(r'^"[0-9a-fA-F]{32,64}(?:-\d+)?"$')
+_MONAT_RE = re.compile(r'(januar|februar|märz|april|mai|juni|juli|august|september|oktober|november|dezember)')
+
+def _iframe_pdf_url(src):
+    """
+    Ermittelt die PDF-URL aus der Quelle eines Iframes.
+
+    PDF-Viewer wie viewer.html?file=... erhalten die Datei über den Parameter 'file'; ohne
+    diesen Parameter zählt die Quelle nur, wenn sie selbst auf ein PDF verweist.
+
+    Args:
+        src (str): src-Attribut des Iframes
+
+    Returns:
+        str: PDF-URL (relativ zur Iframe-Quelle aufgelöst) oder None
+    """
+    viewer_files = [value for value in parse_qs(urlparse(src).query).get('file', []) if '.pdf' in value]
+    if viewer_files:
+        return urljoin(src, viewer_files[0])
+    if '.pdf' in src:
+        return src
+    return None
+
+class _PdfLinkParser(HTMLParser):
+    """Sammelt PDF-Verweise (Embeds, Iframes, Links und data-src-Attribute) aus statischem HTML."""
+
+    def __init__(self):
+        super().__init__()
+        self.embeds = []
+        self.iframes = []
+        self.links = []
+        self.hrefs = []
+        self.data_srcs = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        src = attrs.get('src') or ''
+        href = attrs.get('href') or ''
+        if tag == 'embed' and attrs.get('type') == 'application/pdf' and src:
+            self.embeds.append(src)
+        elif tag == 'iframe' and _iframe_pdf_url(src):
+            self.iframes.append(_iframe_pdf_url(src))
+        elif tag == 'a' and '.pdf' in href:
+            self.links.append(href)
+        elif href.endswith('.pdf'):
+            self.hrefs.append(href)
+        if '.pdf' in (attrs.get('data-src') or ''):
+            self.data_srcs.append(attrs['data-src'])
+
+    def first_pdf_url(self):
+        """Gibt den ersten gefundenen PDF-Verweis in derselben Reihenfolge wie die Suche im Browser zurück."""
+        for candidates in (self.embeds, self.iframes, self.links, self.hrefs, self.data_srcs):
+            if candidates:
+                return candidates[0]
+        return None
+
+class _HashingWriter:
+    """Schreibt Daten in eine Datei und berechnet dabei gleichzeitig ihren SHA-256-Hash."""
+
+    def __init__(self, f):
+        self.f = f
+        self.hasher = hashlib.sha256()
+
+    def write(self, data):
+        self.hasher.update(data)
+        return self.f.write(data)
+
+    def hexdigest(self):
+        return self.hasher.hexdigest()
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTP-Adapter, der ausgehende Anfragen mit einem Token-Bucket begrenzt.
+
+    Der Adapter wird von allen Download-Threads gemeinsam genutzt und ist daher thread-sicher.
+    """
+
+    def __init__(self, rate, burst, **kwargs):
+        self._rate = rate
+        self._burst = burst
+        self._tokens = burst
+        self._last_refill = time.monotonic()
+        self._bucket_lock = threading.Lock()
+        super().__init__(**kwargs)
+
+    def _acquire_token(self):
+        """Blockiert, bis ein Token verfügbar ist."""
+        while True:
+            with self._bucket_lock:
+                now = time.monotonic()
+                self._tokens = min(self._burst, self._tokens + (now - self._last_refill) * self._rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+    def send(self, request, **kwargs):
+        self._acquire_token()
+        return super().send(request, **kwargs)
+
+class _BrowserPool:
+    """
+    Hält einen Playwright-Treiber und je Headless-Modus einen Chromium-Browser prozessweit vor.
+
+    Wiederholte Aufrufe von ``AldiProspektScraper.run`` innerhalb derselben Event-Loop nutzen
+    denselben Browser, statt Chromium jedes Mal neu zu starten. Jedes ``acquire`` muss mit
+    ``release`` beendet werden, beim Beenden des Programms muss ``close`` aufgerufen werden.
+    Nach MAX_USES Läufen wird der Browser neu gestartet, damit sich Speicherlecks von Chromium
+    in langlebigen Prozessen nicht aufsummieren. Ein ausgemusterter Browser wird erst geschlossen,
+    wenn ihn kein Lauf mehr verwendet.
+    """
+
+    # Für die Prospektseiten werden weder GPU noch Erweiterungen oder Hintergrunddienste benötigt
+    LAUNCH_ARGS = [
+        "--disable-gpu",
+        "--disable-dev-shm-usage",
+        "--disable-extensions",
+        "--no-first-run",
+        "--disable-background-networking"
+    ]
+
+    MAX_USES = 20  # Anzahl Läufe, nach denen der Browser neu gestartet wird
+
+    _playwright = None
+    _browsers = {}  # Aktueller Browser je Headless-Modus
+    _uses = {}  # Anzahl bisheriger Läufe je Browser
+    _active = {}  # Anzahl laufender Läufe je Browser
+    _loop = None
+    _lock = None
+
+    @classmethod
+    async def acquire(cls, headless=True):
+        """Gibt den gemeinsamen Browser für den Headless-Modus zurück und startet ihn bei Bedarf."""
+        loop = asyncio.get_running_loop()
+        if cls._loop is not loop:
+            # Playwright-Objekte sind an die Event-Loop gebunden, in der sie erstellt wurden
+            cls._playwright = None
+            cls._browsers = {}
+            cls._uses = {}
+            cls._active = {}
+            cls._loop = loop
+            cls._lock = asyncio.Lock()
+
+        async with cls._lock:
+            browser = cls._browsers.get(headless)
+            if browser is not None and (not browser.is_connected() or cls._uses[browser] >= cls.MAX_USES):
+                # Neue Läufe erhalten einen frischen Browser, laufende behalten den bisherigen
+                del cls._browsers[headless]
+                if not cls._active[browser]:
+                    await cls._close_browser(browser)
+                browser = None
+
+            if browser is None:
+                if cls._playwright is None:
+                    cls._playwright = await async_playwright().start()
+                browser = await cls._playwright.chromium.launch(headless=headless, args=cls.LAUNCH_ARGS)
+                cls._browsers[headless] = browser
+                cls._uses[browser] = 0
+                cls._active[browser] = 0
+                logger.info("Browser gestartet")
+
+            cls._uses[browser] += 1
+            cls._active[browser] += 1
+            return browser
+
+    @classmethod
+    async def release(cls, browser):
+        """Gibt einen mit ``acquire`` erhaltenen Browser zurück und schließt ihn, falls er ausgemustert ist."""
+        if cls._loop is not asyncio.get_running_loop() or browser not in cls._active:
+            return
+        async with cls._lock:
+            cls._active[browser] -= 1
+            if not cls._active[browser] and browser not in cls._browsers.values():
+                await cls._close_browser(browser)
+
+    @classmethod
+    async def _close_browser(cls, browser):
+        """Schließt einen Browser, Fehler eines bereits beendeten Browsers werden ignoriert."""
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.warning(f"Fehler beim Schließen des Browsers: {str(e)}")
+        cls._uses.pop(browser, None)
+        cls._active.pop(browser, None)
+
+    @classmethod
+    async def close(cls):
+        """Schließt alle Browser und beendet den Playwright-Treiber."""
+        if cls._loop is not asyncio.get_running_loop():
+            return
+        for browser in list(cls._uses):
+            await cls._close_browser(browser)
+        cls._browsers = {}
+        if cls._playwright is not None:
+            await cls._playwright.stop()
+            cls._playwright = None
+
 class AldiProspektScraper:
     """Klasse zum Scrapen und Herunterladen von Aldi Süd Prospekten mit Playwright."""
 
     BASE_URL = "https://www.aldi-sued.de/de/angebote/prospekte.html"
     METADATA_FILE = "prospekte_metadata.json"
+    STORAGE_STATE_FILE = "browser_state.json"  # Gespeicherte Cookies inklusive Cookie-Zustimmung
+    COOKIE_TIMEOUT = 10000  # Wartezeit auf das Cookie-Banner in Millisekunden
+    COOKIE_TIMEOUT_STORED = 2000  # Kürzere Wartezeit, wenn die Zustimmung aus einem früheren Lauf vorliegt
+    METADATA_SAVE_INTERVAL = 5  # Mindestabstand zwischen zwei Schreibvorgängen der Metadaten in Sekunden
+    DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB pro Lese-/Schreibvorgang beim PDF-Download
+    MAX_DOWNLOAD_WORKERS = 8  # Anzahl paralleler PDF-Downloads
+    MAX_CONCURRENT_PAGES = 5  # Anzahl gleichzeitig geöffneter Prospektseiten
+    MAX_REQUESTS_PER_SECOND = 5  # Obergrenze für HTTP-Anfragen an den Server
+    REQUEST_TIMEOUT = (5, 30)  # Verbindungs- und Lese-Timeout für HTTP-Anfragen in Sekunden
+    BLOCKED_RESOURCE_TYPES = {"image", "stylesheet", "font", "media"}  # Für die PDF-Suche nicht benötigt
+    BLOCKED_HOSTS = ("google-analytics", "googletagmanager", "doubleclick", "hotjar")  # Tracking- und Analysedienste
+    # Liefert für jede eindeutige Prospekt-URL die URL und den Titel (aus einem Titel-Element oder dem Link-Text)
+    FLYER_LINKS_JS = """
+        links => {
+            const seen = new Set();
+            return links.filter(link => {
+                const url = link.getAttribute('href');
+                if (!url || seen.has(url)) {
+                    return false;
+                }
+                seen.add(url);
+                return true;
+            }).map(link => {
+                const titleElem = link.querySelector("div[class*='title'], div[class*='headline']");
+                const text = titleElem ? titleElem.textContent : link.textContent;
+                return {url: link.getAttribute('href'), title: (text || '').trim()};
+            });
+        }
+    """
+    # Liefert für jede DOM-basierte Suchmethode das erste passende Attribut (oder null)
+    PDF_CANDIDATES_JS = """
+        () => {
+            const attr = (selector, name) => {
+                const element = document.querySelector(selector);
+                return element ? element.getAttribute(name) : null;
+            };
+            return {
+                embed: attr("embed[type='application/pdf']", 'src'),
+                iframe: attr("iframe[src*='.pdf'], iframe[src*='viewer']", 'src'),
+                link: attr("a[href*='.pdf']", 'href'),
+                href: attr("[href$='.pdf']", 'href'),
+                data_src: attr("[data-src*='.pdf']", 'data-src')
+            };
+        }
+    """
+    # Sucht in allen Script-Tags nach der ersten in Anführungszeichen stehenden PDF-URL
+    SCRIPT_PDF_JS = r"""
+        () => {
+            for (const script of document.scripts) {
+                const match = (script.textContent || '').match(/['"]([^'"]*\.pdf)['"]/);
+                if (match) return match[1];
+            }
+            return null;
+        }
+    """
+    PDF_INDICATOR_SELECTOR = (
+        "embed[type='application/pdf'], iframe[src*='.pdf'], iframe[src*='viewer'], "
+        "a[href*='.pdf'], [data-src*='.pdf']"
+    )
+    PDF_WAIT_TIMEOUT = 3000  # Maximale Wartezeit auf ein PDF-Element in Millisekunden
+    PDF_RESPONSE_TIMEOUT = 3  # Maximale Wartezeit auf eine PDF-Antwort im Netzwerkverkehr in Sekunden
+    FLYER_CACHE_TTL = timedelta(hours=6)  # So lange gilt eine bekannte PDF-URL ohne erneute Prüfung der Prospektseite
+
+    # Stichwort in URL oder Titel, Prospekttyp und ob der Monat als Datum übernommen wird
+    PROSPEKT_TYPEN = (
+        ("reisemagazin", "Reisemagazin", True),
+        ("garten", "Garten-Broschüre", False),
+        ("themenkatalog", "Themenkatalog", True),
+        ("inlineflyer", "Inlineflyer", False)
+    )
 
-    def __init__(self, output_dir="./prospekte", headless=True, force_download=False, debug=False):
+    def __init__(self, output_dir="./prospekte", headless=True, force_download=False, debug=False, concurrency=None,
+                 force_rescrape=False, revalidate=False):
         """
         Initialisiert den Scraper.
 
@@ -43,13 +331,34 @@ class AldiProspektScraper:
             headless (bool): Ob der Browser im Headless-Modus ausgeführt werden soll
             force_download (bool): Ob Prospekte erneut heruntergeladen werden sollen, auch wenn sie bereits existieren
             debug (bool): Ob Debug-Screenshots erstellt werden sollen, wenn ein Fehler auftritt
+            concurrency (int): Anzahl gleichzeitig verarbeiteter Prospektseiten (Standard: MAX_CONCURRENT_PAGES)
+            force_rescrape (bool): Ob Prospektseiten erneut ausgewertet werden sollen, auch wenn ihre PDF-URL bekannt ist
+            revalidate (bool): Ob bekannte Prospekte per bedingter Anfrage geprüft und bei Änderung erneut geladen werden sollen
         """
         self.output_dir = output_dir
         self.headless = headless
         self.force_download = force_download
         self.debug = debug
+        self.concurrency = concurrency if concurrency is not None else self.MAX_CONCURRENT_PAGES
+        self.force_rescrape = force_rescrape
+        self.revalidate = revalidate
         self.metadata_path = os.path.join(output_dir, self.METADATA_FILE)
+        self.storage_state_path = os.path.join(output_dir, self.STORAGE_STATE_FILE)
         self.metadata = self._load_metadata()
+        # Ältere Metadaten-Dateien enthalten noch keinen Cache der Prospektseiten und keinen Inhaltsindex
+        self.metadata.setdefault("flyer_cache", {})
+        self.metadata.setdefault("content_index", {})
+        # Indizes über Typ, Kalenderwoche bzw. Datum und Jahr sowie über den Dateipfad,
+        # damit die Duplikaterkennung nicht alle Einträge durchsuchen muss
+        self._info_index = {}
+        self._filepath_index = {}
+        for url_hash, record in self.metadata["prospekte"].items():
+            self._index_record(url_hash, record)
+        self._metadata_lock = threading.RLock()
+        self._metadata_saved_at = 0.0
+        # Zeitstempel für eindeutige Dateinamen, wird zu Beginn jedes Laufs einmal festgelegt
+        self._date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.session = self._create_session()
 
         # Ausgabeverzeichnis erstellen, falls es nicht existiert
         os.makedirs(output_dir, exist_ok=True)
@@ -58,46 +367,238 @@ class AldiProspektScraper:
         """Lädt die Metadaten der bereits heruntergeladenen Prospekte."""
         if os.path.exists(self.metadata_path):
             try:
+                # Einträge für nicht mehr existierende Dateien werden erst entfernt, wenn die
+                # Duplikaterkennung auf sie stößt, oder vollständig mit compact_metadata
                 with open(self.metadata_path, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
+                    return json.load(f)
+            except Exception as e:
+                logger.warning(f"Fehler beim Laden der Metadaten: {str(e)}")
+        return {"prospekte": {}, "last_update": "", "file_hashes": {}, "flyer_cache": {}, "content_index": {}}
 
-                    # Überprüfen, ob alle in den Metadaten aufgeführten Dateien noch existieren
-                    # und entferne Einträge für nicht mehr existierende Dateien
-                    to_remove = []
-                    for url_hash, info in metadata["prospekte"].items():
-                        if "filepath" in info and not os.path.exists(info["filepath"]):
-                            to_remove.append(url_hash)
+    def _write_metadata_file(self, metadata):
+        """
+        Schreibt die Metadaten atomar: erst in eine temporäre Datei, die dann die alte Datei ersetzt.
 
-                    for url_hash in to_remove:
-                        del metadata["prospekte"][url_hash]
+        Bricht das Programm während des Schreibens ab, bleibt die bisherige Metadaten-Datei vollständig erhalten.
+        """
+        temp_path = f"{self.metadata_path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temp_path, self.metadata_path)
 
-                    # Wenn Dateien entfernt wurden, speichere die aktualisierten Metadaten
-                    if to_remove:
-                        with open(self.metadata_path, 'w', encoding='utf-8') as f:
-                            json.dump(metadata, f, ensure_ascii=False, indent=2)
+    def _save_metadata(self, force=False):
+        """
+        Speichert die Metadaten der heruntergeladenen Prospekte.
+
+        Änderungen werden höchstens alle METADATA_SAVE_INTERVAL Sekunden geschrieben, damit nicht
+        jeder einzelne Download die gesamte Datei neu schreibt. ``run`` schreibt am Ende mit
+        ``force=True`` alle noch ausstehenden Änderungen.
 
-                    return metadata
+        Args:
+            force (bool): Ob sofort geschrieben werden soll, unabhängig vom letzten Schreibzeitpunkt
+        """
+        with self._metadata_lock:
+            if not force and time.monotonic() - self._metadata_saved_at < self.METADATA_SAVE_INTERVAL:
+                return
+
+            self.metadata["last_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            try:
+                self._write_metadata_file(self.metadata)
+                self._metadata_saved_at = time.monotonic()
             except Exception as e:
-                logger.warning(f"Fehler beim Laden der Metadaten: {str(e)}")
-        return {"prospekte": {}, "last_update": "", "file_hashes": {}}
+                logger.warning(f"Fehler beim Speichern der Metadaten: {str(e)}")
 
-    def _save_metadata(self):
-        """Speichert die Metadaten der heruntergeladenen Prospekte."""
-        self.metadata["last_update"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        try:
-            with open(self.metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            logger.warning(f"Fehler beim Speichern der Metadaten: {str(e)}")
+    def _dedup_key(self, info):
+        """
+        Schlüssel, unter dem gleichartige Prospekte als Duplikate gelten.
+
+        Wochenangebote und Inlineflyer werden anhand von Kalenderwoche und Jahr verglichen,
+        Reisemagazine und Themenkataloge anhand von Datum und Jahr.
+
+        Returns:
+            tuple: Schlüssel oder None, wenn für den Typ keine Duplikaterkennung stattfindet
+        """
+        typ = info.get("typ", "")
+        if typ in ("Wochenangebot", "Inlineflyer"):
+            return (typ, info.get("kalenderwoche", ""), str(info.get("jahr", "")))
+        if typ in ("Reisemagazin", "Themenkatalog"):
+            return (typ, info.get("datum", ""), str(info.get("jahr", "")))
+        return None
+
+    def _index_record(self, url_hash, record):
+        """Nimmt einen Metadaten-Eintrag in die Indizes für die Duplikaterkennung auf."""
+        key = self._dedup_key(record.get("info", {}))
+        for index, index_key in ((self._info_index, key), (self._filepath_index, record.get("filepath"))):
+            if index_key:
+                url_hashes = index.setdefault(index_key, [])
+                if url_hash not in url_hashes:
+                    url_hashes.append(url_hash)
+
+    def _store_record(self, url_hash, record):
+        """Speichert einen Metadaten-Eintrag und hält die Indizes aktuell. Muss unter der Metadaten-Sperre aufgerufen werden."""
+        self.metadata["prospekte"][url_hash] = record
+        self._index_record(url_hash, record)
+
+    def _forget_record(self, url_hash):
+        """Entfernt einen Eintrag, dessen Datei nicht mehr existiert. Muss unter der Metadaten-Sperre aufgerufen werden."""
+        if self.metadata["prospekte"].pop(url_hash, None) is not None:
+            logger.debug(f"Veralteten Metadaten-Eintrag entfernt: {url_hash}")
+
+    def _find_duplicate(self, dedup_key, filepath=None, url_hash=None):
+        """
+        Sucht einen gespeicherten Prospekt, dessen Datei noch existiert.
+
+        Geprüft werden der Eintrag der URL selbst, alle Einträge mit demselben Duplikatschlüssel
+        und der Eintrag, dem der Dateipfad gehört. Einträge für gelöschte Dateien werden dabei entfernt.
+        Muss unter der Metadaten-Sperre aufgerufen werden.
+
+        Args:
+            dedup_key (tuple): Schlüssel aus _dedup_key oder None
+            filepath (str): Zielpfad der Datei
+            url_hash (str): MD5-Hash der PDF-URL
+
+        Returns:
+            dict: Metadaten-Eintrag oder None, wenn kein Duplikat vorhanden ist
+        """
+        by_key = ([url_hash] if url_hash else []) + (self._info_index.get(dedup_key, []) if dedup_key else [])
+        by_path = self._filepath_index.get(filepath, []) if filepath else []
+        for stored_hash, match_path in [(h, False) for h in by_key] + [(h, True) for h in by_path]:
+            stored_info = self.metadata["prospekte"].get(stored_hash)
+            # Der Dateipfad-Index kann auf Einträge verweisen, die inzwischen eine andere Datei beschreiben
+            if not stored_info or (match_path and stored_info["filepath"] != filepath):
+                continue
+            if not os.path.exists(stored_info["filepath"]):
+                self._forget_record(stored_hash)
+                continue
+            return stored_info
+        return None
+
+    def compact_metadata(self):
+        """
+        Entfernt alle Einträge, deren Dateien nicht mehr existieren, samt ihren Verweisen in den
+        Indizes und speichert die Metadaten.
+
+        Returns:
+            int: Anzahl der entfernten Einträge
+        """
+        with self._metadata_lock:
+            stale = [
+                url_hash for url_hash, record in self.metadata["prospekte"].items()
+                if "filepath" in record and not os.path.exists(record["filepath"])
+            ]
+            for url_hash in stale:
+                self._forget_record(url_hash)
+
+            # Hash- und Inhaltsindex sowie die Indizes im Speicher dürfen nicht mehr auf entfernte Einträge verweisen
+            prospekte = self.metadata["prospekte"]
+            for index_name in ("file_hashes", "content_index"):
+                self.metadata[index_name] = {
+                    key: url_hash for key, url_hash in self.metadata.get(index_name, {}).items() if url_hash in prospekte
+                }
+            self._info_index = {}
+            self._filepath_index = {}
+            for url_hash, record in prospekte.items():
+                self._index_record(url_hash, record)
+            self._save_metadata(force=True)
+        logger.info(f"{len(stale)} veraltete Metadaten-Einträge entfernt")
+        return len(stale)
+
+    def _create_session(self):
+        """Erstellt eine HTTP-Session, deren Verbindungen von allen Download-Threads wiederverwendet werden."""
+        session = requests.Session()
+        # Wiederholungen mit exponentiellem Backoff; bei 429 und 503 hat ein Retry-After-Header des Servers Vorrang
+        adapter = _RateLimitedAdapter(
+            rate=self.MAX_REQUESTS_PER_SECOND,
+            burst=self.MAX_REQUESTS_PER_SECOND,
+            pool_connections=16,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                respect_retry_after_header=True
+            )
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def _unique_filename(self, base_filename, url_hash):
+        """
+        Erstellt einen noch nicht vergebenen Dateinamen mit dem Zeitstempel des Laufs.
+
+        Ist der Name mit Zeitstempel bereits belegt, etwa durch einen anderen Prospekt derselben
+        Kalenderwoche im selben Lauf, wird der Anfang des URL-Hashes und notfalls ein Zähler angehängt.
+        Muss unter der Metadaten-Sperre aufgerufen werden.
+
+        Args:
+            base_filename (str): Dateiname ohne Endung
+            url_hash (str): MD5-Hash der PDF-URL
+
+        Returns:
+            str: Dateiname mit Endung .pdf
+        """
+        filename = f"{base_filename}_{self._date_str}.pdf"
+        counter = 1
+        while os.path.exists(os.path.join(self.output_dir, filename)):
+            suffix = url_hash[:8] if counter == 1 else f"{url_hash[:8]}_{counter}"
+            filename = f"{base_filename}_{self._date_str}_{suffix}.pdf"
+            counter += 1
+        return filename
 
     def _get_file_hash(self, file_path):
         """Berechnet den SHA-256-Hash einer Datei."""
-        hasher = hashlib.sha256()
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            self._advise_sequential(f)
+            # hashlib.file_digest (ab Python 3.11) liest die Datei ohne Python-Schleife
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            hasher = hashlib.sha256()
+            for chunk in iter(lambda: f.read(self.DOWNLOAD_CHUNK_SIZE), b""):
                 hasher.update(chunk)
         return hasher.hexdigest()
 
+    def _advise_sequential(self, f):
+        """Teilt dem Kernel mit, dass die Datei sequentiell verarbeitet wird (nur POSIX)."""
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError as e:
+            logger.debug(f"posix_fadvise fehlgeschlagen: {str(e)}")
+
+    def _content_key(self, response):
+        """
+        Schlüssel für den Inhaltsindex aus ETag und Content-Length einer Antwort.
+
+        ETags gelten eigentlich nur für eine einzelne Ressource. URL-übergreifend werden daher nur
+        starke ETags verwendet, die wie ein Hash des Inhalts aussehen; schwache ETags (W/) und ETags
+        aus Änderungszeit und Größe, wie sie z.B. nginx erzeugt, können bei verschiedenen Dateien gleich sein.
+
+        Returns:
+            str: Schlüssel oder None, wenn der Server keine geeigneten Header liefert
+        """
+        etag = response.headers.get('ETag')
+        content_length = response.headers.get('Content-Length')
+        # Bei komprimierter Übertragung beschreibt Content-Length nicht die eigentliche Datei
+        if not etag or not content_length or response.headers.get('Content-Encoding'):
+            return None
+        if not _CONTENT_ETAG_RE.match(etag):
+            return None
+        return f"{etag}|{content_length}"
+
+    def _preallocate(self, f, response):
+        """Reserviert Speicherplatz für den Download vorab, wenn die Dateigröße bekannt ist (nur POSIX)."""
+        content_length = response.headers.get('Content-Length')
+        # Bei komprimierter Übertragung entspricht Content-Length nicht der Größe der dekodierten Datei
+        if not hasattr(os, 'posix_fallocate') or not content_length or response.headers.get('Content-Encoding'):
+            return
+        try:
+            f.flush()
+            os.posix_fallocate(f.fileno(), 0, int(content_length))
+        except (OSError, ValueError) as e:
+            logger.debug(f"Speicherplatz konnte nicht vorab reserviert werden: {str(e)}")
+
     def _extract_prospekt_info(self, url, title):
         """
         Extrahiert Informationen über den Prospekt aus der URL und dem Titel.
@@ -114,86 +615,111 @@ class AldiProspektScraper:
         }
 
         # Versuchen, Informationen aus der URL zu extrahieren
-        url_path = urlparse(url).path
-        filename = os.path.basename(url_path)
+        parsed_url = urlparse(url)
+        url_lower = url.lower()
+        # URL und Titel werden einmal gemeinsam in Kleinbuchstaben umgewandelt und dann durchsucht
+        hay = (url + " " + title).lower()
 
         # Kalenderwoche aus URL oder Titel extrahieren
-        kw_match = re.search(r'kw(\d+)', url.lower() + " " + title.lower())
+        kw_match = _KW_RE.search(hay)
         if kw_match:
             info["kalenderwoche"] = kw_match.group(1)
             info["typ"] = "Wochenangebot"
 
         # Jahr aus URL oder Titel extrahieren
-        jahr_match = re.search(r'20(\d{2})', url + " " + title)
+        jahr_match = _JAHR_RE.search(hay)
         if jahr_match:
             info["jahr"] = "20" + jahr_match.group(1)
 
-        # Spezielle Prospekttypen erkennen
-        if "reisemagazin" in url.lower() or "reisemagazin" in title.lower():
-            info["typ"] = "Reisemagazin"
-            monat_match = re.search(r'(januar|februar|märz|april|mai|juni|juli|august|september|oktober|november|dezember)',
-                                   url.lower() + " " + title.lower())
-            if monat_match:
-                info["datum"] = monat_match.group(1).capitalize()
-
-        elif "garten" in url.lower() or "garten" in title.lower():
-            info["typ"] = "Garten-Broschüre"
-
-        elif "themenkatalog" in url.lower() or "themenkatalog" in title.lower():
-            info["typ"] = "Themenkatalog"
-            monat_match = re.search(r'(januar|februar|märz|april|mai|juni|juli|august|september|oktober|november|dezember)',
-                                   url.lower() + " " + title.lower())
-            if monat_match:
-                info["datum"] = monat_match.group(1).capitalize()
-
-        elif "inlineflyer" in url.lower() or "inlineflyer" in title.lower():
-            info["typ"] = "Inlineflyer"
+        # Spezielle Prospekttypen erkennen, der erste passende Eintrag gewinnt
+        for stichwort, typ, mit_monat in self.PROSPEKT_TYPEN:
+            if stichwort in hay:
+                info["typ"] = typ
+                if mit_monat:
+                    monat_match = _MONAT_RE.search(hay)
+                    if monat_match:
+                        info["datum"] = monat_match.group(1).capitalize()
+                break
 
         # Versuchen, Datum aus Query-Parametern zu extrahieren
-        query_params = parse_qs(urlparse(url).query)
+        query_params = parse_qs(parsed_url.query)
         if "valid_from" in query_params:
             info["datum"] = query_params["valid_from"][0]
 
         # Extrahiere Kalenderwoche aus dem Inlineflyer-Namen, falls vorhanden
         if info["typ"] == "Inlineflyer" and not info["kalenderwoche"]:
-            kw_match = re.search(r'kw[-_]?(\d+)', url.lower())
+            kw_match = _KW_INLINE_RE.search(url_lower)
             if kw_match:
                 info["kalenderwoche"] = kw_match.group(1)
-            elif "kw" in url.lower():
+            elif "kw" in url_lower:
                 # Versuche, die Zahl nach "kw" zu extrahieren
-                kw_num_match = re.search(r'kw[^0-9]*(\d+)', url.lower())
+                kw_num_match = _KW_LOOSE_RE.search(url_lower)
                 if kw_num_match:
                     info["kalenderwoche"] = kw_num_match.group(1)
 
         return info
 
-    async def handle_cookies(self, page):
-        """Cookie-Consent-Banner behandeln."""
+    async def _block_resources(self, route):
+        """
+        Bricht Anfragen nach Bildern, Stylesheets, Schriften, Medien und an Analysedienste ab,
+        alle anderen werden durchgelassen. PDF-Anfragen werden nie blockiert.
+        """
+        request = route.request
+        if '.pdf' not in request.url and (
+            request.resource_type in self.BLOCKED_RESOURCE_TYPES
+            or any(host in request.url for host in self.BLOCKED_HOSTS)
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def handle_cookies(self, page, timeout=None, consent_stored=False):
+        """
+        Cookie-Consent-Banner behandeln.
+
+        Args:
+            page: Playwright-Seitenobjekt
+            timeout (int): Wartezeit auf das Banner in Millisekunden (Standard: COOKIE_TIMEOUT)
+            consent_stored (bool): Ob die Zustimmung aus einem früheren Lauf geladen wurde
+        """
         try:
             # Auf Cookie-Banner warten
-            cookie_button = await page.wait_for_selector("button:text('Alle bestätigen')", timeout=10000)
+            cookie_button = await page.wait_for_selector(
+                "button:text('Alle bestätigen')", timeout=timeout or self.COOKIE_TIMEOUT
+            )
             if cookie_button:
                 await cookie_button.click()
                 logger.info("Cookies akzeptiert")
-                await asyncio.sleep(2)  # Warten, bis das Banner verschwindet
+                # Warten, bis das Banner verschwindet
+                try:
+                    await cookie_button.wait_for_element_state("hidden", timeout=5000)
+                except Exception:
+                    logger.debug("Cookie-Banner nach dem Akzeptieren weiterhin sichtbar")
         except Exception:
-            logger.warning("Cookie-Banner nicht gefunden oder bereits akzeptiert")
+            if consent_stored:
+                # Mit gespeicherter Zustimmung erscheint das Banner normalerweise nicht mehr
+                logger.debug("Cookie-Banner nicht angezeigt, gespeicherte Zustimmung wird verwendet")
+            else:
+                logger.warning("Cookie-Banner nicht gefunden oder bereits akzeptiert")
 
-    async def get_flyer_links(self, page):
+    async def get_flyer_links(self, page, cookie_timeout=None, consent_stored=False):
         """
         Links zu Prospekten von der Aldi Süd Prospekte-Seite extrahieren.
 
         Args:
             page: Playwright-Seitenobjekt
+            cookie_timeout (int): Wartezeit auf das Cookie-Banner in Millisekunden
+            consent_stored (bool): Ob die Cookie-Zustimmung aus einem früheren Lauf geladen wurde
 
         Returns:
             list: Liste von Dictionaries mit Prospektinformationen
         """
-        await page.goto(self.BASE_URL)
+        # Nur auf das DOM warten, die Prospekt-Links werden unten gezielt abgewartet
+        await page.goto(self.BASE_URL, wait_until='domcontentloaded')
         logger.info(f"Zu {self.BASE_URL} navigiert")
 
         # Cookie-Consent behandeln
-        await self.handle_cookies(page)
+        await self.handle_cookies(page, cookie_timeout, consent_stored)
 
         # Warten, bis Prospekte geladen sind
         try:
@@ -205,12 +731,12 @@ class AldiProspektScraper:
         # Alle Prospekt-Links finden
         flyer_links = []
 
-        # Alle Links zu Prospekten holen
-        links = await page.query_selector_all("a[href*='prospekt.aldi-sued.de']")
+        # Href und Titeltexte aller Prospekt-Links in einem einzigen Aufruf aus dem Browser holen,
+        # doppelte URLs werden dabei bereits im Browser aussortiert
+        links = await page.eval_on_selector_all("a[href*='prospekt.aldi-sued.de']", self.FLYER_LINKS_JS)
 
         for link in links:
-            # URL holen
-            url = await link.get_attribute('href')
+            url = link['url']
 
             # Titel aus der URL extrahieren, falls möglich
             url_title = "Aldi Prospekt"  # Standard-Titel
@@ -225,35 +751,121 @@ class AldiProspektScraper:
                     # URL-Teil bereinigen, um einen lesbaren Titel zu erstellen
                     if last_part:
                         url_title = last_part.replace('-', ' ').replace('_', ' ')
-                        url_title = re.sub(r'\d{2,4}$', '', url_title)  # Jahreszahlen am Ende entfernen
+                        url_title = _YEAR_TAIL_RE.sub('', url_title)  # Jahreszahlen am Ende entfernen
                         url_title = url_title.strip()
                         url_title = ' '.join(word.capitalize() for word in url_title.split())
 
             # Versuchen, den Titel von der Seite zu holen
             title = url_title  # URL-abgeleiteten Titel als Fallback verwenden
 
-            # Versuchen, Titel aus Kind-Elementen zu holen
-            title_elem = await link.query_selector("div[class*='title'], div[class*='headline']")
-            if title_elem:
-                page_title = await title_elem.text_content()
-                if page_title and page_title.strip():
-                    title = page_title.strip()
-            else:
-                # Wenn kein Titel gefunden wurde, versuchen, den Link-Text zu holen
-                link_text = await link.text_content()
-                if link_text and link_text.strip():
-                    title = link_text.strip()
-
-            # Zur Liste hinzufügen, wenn noch nicht vorhanden
-            if url and url not in [f['url'] for f in flyer_links]:
-                flyer_links.append({
-                    'title': title,
-                    'url': url
-                })
-                logger.info(f"Prospekt gefunden: {title} - {url}")
+            # Titel aus Kind-Elementen oder, falls keine vorhanden sind, aus dem Link-Text verwenden
+            if link['title']:
+                title = link['title']
+
+            flyer_links.append({
+                'title': title,
+                'url': url
+            })
+            logger.info(f"Prospekt gefunden: {title} - {url}")
 
         return flyer_links
 
+    def _check_flyer_cache(self, flyer_url):
+        """
+        Prüft, ob die PDF-URL einer bereits besuchten Prospektseite ohne Anfrage weiterverwendet werden kann.
+
+        Einträge, die jünger als FLYER_CACHE_TTL sind, gelten als aktuell. Ältere Einträge werden
+        zurückgegeben, damit _try_http_extract sie per bedingter Anfrage erneut prüfen kann.
+
+        Args:
+            flyer_url (str): URL der Prospektseite
+
+        Returns:
+            tuple: (PDF-URL, falls der Eintrag noch gültig ist, sonst None; Cache-Eintrag oder None)
+        """
+        with self._metadata_lock:
+            cached = None if self.force_rescrape else self.metadata["flyer_cache"].get(flyer_url)
+
+        if cached and cached.get("scraped_at"):
+            try:
+                scraped_at = datetime.strptime(cached["scraped_at"], "%Y-%m-%d %H:%M:%S")
+                if datetime.now() - scraped_at < self.FLYER_CACHE_TTL:
+                    return cached.get("pdf_url"), cached
+            except ValueError:
+                pass
+        return None, cached
+
+    def _remember_flyer(self, flyer_url, pdf_url, validators):
+        """Speichert die PDF-URL einer Prospektseite zusammen mit ihren Validatoren im Cache."""
+        with self._metadata_lock:
+            self.metadata["flyer_cache"][flyer_url] = {
+                "pdf_url": pdf_url,
+                "etag": validators.get("etag"),
+                "last_modified": validators.get("last_modified"),
+                "scraped_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            }
+
+    def _try_http_extract(self, flyer_url, cached=None):
+        """
+        PDF-URL ohne Browser aus dem statischen HTML der Prospektseite extrahieren.
+
+        Verweist der Prospekt-Link bereits direkt auf ein PDF, wird dessen URL ohne Auswertung übernommen.
+        Liegt ein Cache-Eintrag vor, wird die Seite bedingt angefragt; meldet der Server sie als
+        unverändert (HTTP 304), wird die bekannte PDF-URL ohne erneutes Auswerten weiterverwendet.
+
+        Args:
+            flyer_url (str): URL der Prospektseite
+            cached (dict): Eintrag aus dem flyer_cache mit 'pdf_url', 'etag' und 'last_modified'
+
+        Returns:
+            tuple: (URL der PDF-Datei oder None, Dict mit 'etag' und 'last_modified' der Seite)
+        """
+        if urlparse(flyer_url).path.lower().endswith('.pdf'):
+            return flyer_url, {}
+
+        # Bedingte Anfrage nur, wenn der Eintrag auch eine PDF-URL enthält, die weiterverwendet werden kann
+        headers = {}
+        if cached and cached.get("pdf_url"):
+            if cached.get("etag"):
+                headers['If-None-Match'] = cached["etag"]
+            if cached.get("last_modified"):
+                headers['If-Modified-Since'] = cached["last_modified"]
+
+        try:
+            # Streaming, damit bei einem direkt ausgelieferten PDF nur die Header gelesen werden
+            response = self.session.get(flyer_url, headers=headers, stream=True, timeout=self.REQUEST_TIMEOUT)
+            response.raise_for_status()
+        except Exception as e:
+            logger.debug(f"Statischer Abruf der Prospektseite fehlgeschlagen: {str(e)}")
+            return None, {}
+
+        with response:
+            if response.status_code == 304:
+                # Seite unverändert: Eintrag gilt für eine weitere TTL-Periode
+                logger.info(f"Prospektseite unverändert, verwende bekannte PDF-URL: {flyer_url}")
+                validators = {"etag": cached.get("etag"), "last_modified": cached.get("last_modified")}
+                self._remember_flyer(flyer_url, cached["pdf_url"], validators)
+                return cached["pdf_url"], validators
+
+            validators = {
+                "etag": response.headers.get('ETag'),
+                "last_modified": response.headers.get('Last-Modified')
+            }
+
+            # Weiterleitungen auf ein PDF: die endgültige URL ist bereits die gesuchte PDF-URL
+            if response.headers.get('Content-Type', '').startswith('application/pdf'):
+                return response.url, validators
+
+            parser = _PdfLinkParser()
+            parser.feed(response.text)
+
+        pdf_url = parser.first_pdf_url()
+        if pdf_url:
+            logger.info(f"PDF-URL ohne Browser gefunden: {flyer_url}")
+            pdf_url = urljoin(response.url, pdf_url)
+            self._remember_flyer(flyer_url, pdf_url, validators)
+        return pdf_url, validators
+
     async def extract_pdf_url(self, page, flyer_url):
         """
         PDF-URL von einer Prospektseite extrahieren.
@@ -265,114 +877,124 @@ class AldiProspektScraper:
         Returns:
             str: URL der PDF-Datei oder None, wenn nicht gefunden
         """
+        # Antworten mit PDF-URLs bereits ab der Navigation mitschneiden (für Methode 6)
+        pdf_response = asyncio.get_running_loop().create_future()
+
+        def on_response(response):
+            # Nur echte PDFs zählen; ein Viewer wie viewer.html?file=...pdf enthält '.pdf' nur in der Query
+            is_pdf = (
+                response.headers.get('content-type', '').startswith('application/pdf')
+                or urlparse(response.url).path.lower().endswith('.pdf')
+            )
+            if is_pdf and not pdf_response.done():
+                pdf_response.set_result(response.url)
+
+        page.on('response', on_response)
+
         try:
-            await page.goto(flyer_url, wait_until='networkidle')
+            # Nur auf das DOM warten; 'networkidle' wartet zusätzlich auf Tracking- und Analyse-Anfragen
+            await page.goto(flyer_url, wait_until='domcontentloaded')
             logger.info(f"Navigiere zur Prospektseite: {flyer_url}")
 
-            # Warten, bis die Seite geladen ist
-            await asyncio.sleep(5)
+            # Warten, bis ein PDF-Element im DOM auftaucht oder die Seite selbst ein PDF lädt,
+            # je nachdem, was zuerst eintritt; versteckte Platzhalter und Links ohne Größe (Bilder und
+            # Stylesheets sind blockiert) werden nie sichtbar, daher genügt es, dass das Element existiert
+            selector_task = asyncio.ensure_future(
+                page.wait_for_selector(self.PDF_INDICATOR_SELECTOR, state='attached', timeout=self.PDF_WAIT_TIMEOUT)
+            )
+            await asyncio.wait({selector_task, pdf_response}, return_when=asyncio.FIRST_COMPLETED)
+            if selector_task.done():
+                if selector_task.exception():
+                    logger.debug(f"Kein PDF-Element innerhalb des Timeouts gefunden: {flyer_url}")
+            else:
+                selector_task.cancel()
+
+            # Methode 6 vorziehen: Hat die Seite bereits ein PDF geladen, ist keine DOM-Suche nötig
+            if pdf_response.done():
+                return pdf_response.result()
+
+            # Methoden 1 bis 4 und 7: Alle PDF-Kandidaten in einem einzigen Aufruf im Browser auslesen
+            candidates = await page.evaluate(self.PDF_CANDIDATES_JS)
 
             # Methode 1: Nach PDF-Embed- oder Objekt-Tags suchen
-            pdf_elements = await page.query_selector_all("embed[type='application/pdf']")
-            if pdf_elements:
-                pdf_url = await pdf_elements[0].get_attribute('src')
-                if pdf_url:
-                    return pdf_url
+            if candidates['embed']:
+                return urljoin(flyer_url, candidates['embed'])
 
             # Methode 2: Nach PDF-Viewer-Iframe suchen
-            iframe_elements = await page.query_selector_all("iframe[src*='.pdf'], iframe[src*='viewer']")
-            if iframe_elements:
-                iframe_src = await iframe_elements[0].get_attribute('src')
-                if '.pdf' in iframe_src:
-                    return iframe_src
+            iframe_src = candidates['iframe']
+            if iframe_src:
+                # Wie im statischen HTML: bei einem Viewer die Datei aus dem Parameter 'file' übernehmen
+                iframe_pdf_url = _iframe_pdf_url(iframe_src)
+                if iframe_pdf_url:
+                    return urljoin(flyer_url, iframe_pdf_url)
 
                 # Wenn es ein Viewer ist, zum Iframe wechseln und nach dem PDF suchen
-                frame = page.frame(url=iframe_src)
+                iframe_element = await page.query_selector("iframe[src*='viewer']")
+                frame = await iframe_element.content_frame() if iframe_element else None
                 if frame:
-                    pdf_elements = await frame.query_selector_all("embed[type='application/pdf']")
-                    if pdf_elements:
-                        pdf_url = await pdf_elements[0].get_attribute('src')
-                        if pdf_url:
-                            return pdf_url
+                    frame_candidates = await frame.evaluate(self.PDF_CANDIDATES_JS)
+                    if frame_candidates['embed']:
+                        return urljoin(frame.url, frame_candidates['embed'])
 
             # Methode 3: Nach Download-Links suchen
-            download_links = await page.query_selector_all("a[href*='.pdf']")
-            if download_links:
-                pdf_url = await download_links[0].get_attribute('href')
-                if pdf_url:
-                    return pdf_url
-
-            # Methode 4: Seitenquelle nach PDF-URLs durchsuchen
-            content = await page.content()
-            pdf_matches = re.findall(r'href=[\'"]([^\'"]*\.pdf)[\'"]', content)
-            if pdf_matches:
-                pdf_url = pdf_matches[0]
-                if not pdf_url.startswith('http'):
-                    pdf_url = urljoin(flyer_url, pdf_url)
-                return pdf_url
+            # Methode 4: Beliebige Elemente mit einem auf .pdf endenden href-Attribut suchen
+            # Methode 7: Nach data-src-Attributen suchen
+            for key in ('link', 'href', 'data_src'):
+                if candidates[key]:
+                    return urljoin(flyer_url, candidates[key])
 
             # Methode 5: Nach Download-Buttons suchen
-            download_buttons = await page.query_selector_all("button:text('Download'), button[class*='download']")
-            if download_buttons:
-                await download_buttons[0].click()
-                await asyncio.sleep(2)  # Warten, bis der Download-Link erscheint
-
-                # Erneut nach PDF-Links suchen
-                download_links = await page.query_selector_all("a[href*='.pdf']")
-                if download_links:
-                    pdf_url = await download_links[0].get_attribute('href')
+            # Locator mit .first liefert nur das erste Element, statt alle Treffer aufzuzählen
+            download_button = page.locator("button:text('Download'), button[class*='download']").first
+            if await download_button.count():
+                await download_button.click()
+
+                # Auf den ersten PDF-Link warten, statt eine feste Zeit zu schlafen
+                try:
+                    pdf_url = await page.locator("a[href*='.pdf']").first.get_attribute('href', timeout=2000)
                     if pdf_url:
-                        return pdf_url
+                        return urljoin(flyer_url, pdf_url)
+                except Exception:
+                    logger.debug(f"Kein PDF-Link nach Klick auf Download-Button gefunden: {flyer_url}")
 
             # Methode 6: Netzwerkanfragen nach PDF-Dateien überprüfen
-            # Dies ist eine fortgeschrittenere Methode, die dynamisch geladene PDFs erfassen könnte
-            async def handle_response(response):
-                if '.pdf' in response.url:
-                    return response.url
-
-            page.on('response', handle_response)
-
-            # Seite neu laden, um den Response-Handler auszulösen
-            await page.reload(wait_until='networkidle')
-            await asyncio.sleep(5)  # Auf potenzielle PDF-Responses warten
-
-            # Screenshot für Debugging erstellen, wenn Debug-Modus aktiviert ist
-            if self.debug:
-                screenshot_path = os.path.join(self.output_dir, f"debug_screenshot_{int(datetime.now().timestamp())}.png")
-                await page.screenshot(path=screenshot_path)
-                logger.info(f"Debug-Screenshot gespeichert unter {screenshot_path}")
+            # Der Listener läuft seit der Navigation, daher ist kein erneutes Laden der Seite nötig
+            try:
+                return await asyncio.wait_for(asyncio.shield(pdf_response), timeout=self.PDF_RESPONSE_TIMEOUT)
+            except asyncio.TimeoutError:
+                logger.debug(f"Keine PDF-Antwort im Netzwerkverkehr gefunden: {flyer_url}")
 
-            # Methode 7: Nach data-src-Attributen suchen
-            elements_with_data_src = await page.query_selector_all("[data-src*='.pdf']")
-            if elements_with_data_src:
-                pdf_url = await elements_with_data_src[0].get_attribute('data-src')
-                if pdf_url and not pdf_url.startswith('http'):
+            # Methode 8: Nach PDF-URLs in Script-Tags suchen
+            # Alle Script-Tags werden in einem einzigen Aufruf im Browser durchsucht
+            pdf_url = await page.evaluate(self.SCRIPT_PDF_JS)
+            if pdf_url:
+                if not pdf_url.startswith('http'):
                     pdf_url = urljoin(flyer_url, pdf_url)
                 return pdf_url
 
-            # Methode 8: Nach PDF-URLs in Script-Tags suchen
-            script_tags = await page.query_selector_all("script")
-            for script_tag in script_tags:
-                script_content = await page.evaluate("(element) => element.textContent", script_tag)
-                if script_content:
-                    pdf_matches = re.findall(r'[\'"]([^\'\"]*\.pdf)[\'"]', script_content)
-                    if pdf_matches:
-                        pdf_url = pdf_matches[0]
-                        if not pdf_url.startswith('http'):
-                            pdf_url = urljoin(flyer_url, pdf_url)
-                        return pdf_url
-
             logger.error(f"Keine PDF-URL auf der Seite gefunden: {flyer_url}")
+
+            # Screenshot für Debugging nur erstellen, wenn alle Methoden fehlgeschlagen sind
+            if self.debug:
+                screenshot_path = os.path.join(self.output_dir, f"debug_screenshot_{time.time_ns()}.jpg")
+                # JPEG lässt sich deutlich schneller kodieren als PNG und reicht für die Fehlersuche aus
+                await page.screenshot(path=screenshot_path, type='jpeg', quality=60)
+                logger.info(f"Debug-Screenshot gespeichert unter {screenshot_path}")
             return None
 
         except Exception as e:
             logger.error(f"Fehler beim Extrahieren der PDF-URL: {str(e)}")
             return None
 
+        finally:
+            page.remove_listener('response', on_response)
+
     def download_pdf(self, url, title, flyer_url):
         """
         Eine PDF-Datei herunterladen, wenn sie noch nicht existiert.
 
+        Die Methode ist thread-sicher und wird von ``run`` parallel in einem Thread-Pool aufgerufen.
+
         Args:
             url (str): URL der PDF-Datei
             title (str): Titel für den Dateinamen
@@ -386,34 +1008,72 @@ class AldiProspektScraper:
             url_hash = hashlib.md5(url.encode()).hexdigest()
 
             # Prüfen, ob die URL bereits in den Metadaten vorhanden ist
-            if url_hash in self.metadata["prospekte"] and not self.force_download:
-                existing_file = self.metadata["prospekte"][url_hash]["filepath"]
-                if os.path.exists(existing_file):
+            with self._metadata_lock:
+                known_info = self.metadata["prospekte"].get(url_hash)
+                if known_info and not os.path.exists(known_info["filepath"]):
+                    self._forget_record(url_hash)
+                    known_info = None
+                if known_info and not self.force_download and not self.revalidate:
+                    existing_file = known_info["filepath"]
                     logger.info(f"Prospekt bereits vorhanden: {existing_file}")
                     return existing_file
 
+            # Mit revalidate wird eine bekannte URL bedingt angefragt und nur bei geänderter Datei erneut geladen;
+            # force_download lädt dagegen immer vollständig, um auch beschädigte Dateien zu ersetzen
+            revalidating = bool(known_info) and self.revalidate and not self.force_download
+            replace_existing = self.force_download or revalidating
+            conditional_headers = {}
+            if revalidating:
+                if known_info.get("etag"):
+                    conditional_headers["If-None-Match"] = known_info["etag"]
+                if known_info.get("last_modified"):
+                    conditional_headers["If-Modified-Since"] = known_info["last_modified"]
+
             # Prospektinformationen extrahieren
             prospekt_info = self._extract_prospekt_info(flyer_url, title)
 
-            # Besseren Titel aus der URL oder dem Content-Disposition-Header extrahieren
-            better_title = title
-
-            # Versuchen, einen besseren Titel aus der URL zu holen
-            url_match = re.search(r'([^/]+)\.pdf', url)
-            if url_match:
-                better_title = url_match.group(1)
-
-            # Content-Disposition-Header überprüfen
-            head_response = requests.head(url)
-            if 'content-disposition' in head_response.headers:
-                cd_match = re.search(r'filename\*?=(?:UTF-8\'\'|")?([^"]+)', head_response.headers['content-disposition'])
-                if cd_match:
-                    better_title = cd_match.group(1)
-                    better_title = better_title.replace('%20', ' ').replace('%25', '%')
-                    better_title = re.sub(r'\.pdf$', '', better_title)
-
-            # Eindeutigen Dateinamen erstellen
-            sanitized_title = re.sub(r'[^\w\-_\. ]', '_', better_title)
+            with self._metadata_lock:
+                # Prüfen, ob wir das Prospekt bereits haben, basierend auf Typ, KW bzw. Datum und Jahr
+                dedup_key = self._dedup_key(prospekt_info)
+                if dedup_key and not replace_existing:
+                    stored_info = self._find_duplicate(dedup_key)
+                    if stored_info:
+                        # Füge die neue URL zu den Metadaten hinzu
+                        existing_file = stored_info["filepath"]
+                        self._store_record(url_hash, stored_info)
+                        self._save_metadata()
+                        if prospekt_info["typ"] in ("Reisemagazin", "Themenkatalog"):
+                            logger.info(f"{prospekt_info['typ']} für {prospekt_info['datum']} {prospekt_info['jahr']} bereits vorhanden: {existing_file}")
+                        else:
+                            logger.info(f"{prospekt_info['typ']} für KW{prospekt_info['kalenderwoche']} {prospekt_info['jahr']} bereits vorhanden: {existing_file}")
+                        return existing_file
+
+            # PDF mit einer einzigen Anfrage abrufen; die Header werden ausgewertet, bevor der Inhalt gelesen wird
+            response = self.session.get(url, headers=conditional_headers, stream=True, timeout=self.REQUEST_TIMEOUT)
+            if response.status_code == 304:
+                response.close()
+                logger.info(f"Prospekt unverändert (HTTP 304): {known_info['filepath']}")
+                return known_info["filepath"]
+            if response.status_code != 200:
+                response.close()
+                logger.error(f"PDF-Download fehlgeschlagen: HTTP {response.status_code}")
+                return None
+
+            # Gleiche Datei unter anderer URL: anhand von ETag und Größe erkennen, bevor der Inhalt übertragen wird
+            content_key = self._content_key(response)
+            if content_key and not replace_existing:
+                with self._metadata_lock:
+                    existing_url_hash = self.metadata["content_index"].get(content_key)
+                    existing_info = self.metadata["prospekte"].get(existing_url_hash)
+                    if existing_info and not os.path.exists(existing_info["filepath"]):
+                        self._forget_record(existing_url_hash)
+                        existing_info = None
+                    if existing_info:
+                        response.close()
+                        self._store_record(url_hash, existing_info)
+                        self._save_metadata()
+                        logger.info(f"Identischer Prospekt bereits vorhanden (ETag): {existing_info['filepath']}")
+                        return existing_info["filepath"]
 
             # Dateiname mit Supermarkt, Typ, Kalenderwoche und Jahr erstellen
             filename_parts = []
@@ -438,6 +1098,24 @@ class AldiProspektScraper:
 
             # Wenn keine spezifischen Informationen gefunden wurden, den bereinigten Titel verwenden
             if len(filename_parts) <= 2:  # Nur Supermarkt und Jahr vorhanden
+                # Besseren Titel aus der URL oder dem Content-Disposition-Header extrahieren
+                better_title = title
+
+                # Versuchen, einen besseren Titel aus der URL zu holen
+                url_match = _URL_PDF_RE.search(url)
+                if url_match:
+                    better_title = url_match.group(1)
+
+                # Content-Disposition-Header überprüfen, bevor der Inhalt gelesen wird
+                if 'content-disposition' in response.headers:
+                    cd_match = _CD_FILENAME_RE.search(response.headers['content-disposition'])
+                    if cd_match:
+                        better_title = cd_match.group(1)
+                        better_title = better_title.replace('%20', ' ').replace('%25', '%')
+                        better_title = _PDF_SUFFIX_RE.sub('', better_title)
+
+                sanitized_title = _SANITIZE_RE.sub('_', better_title)
+
                 filename_parts = [prospekt_info["supermarkt"], sanitized_title]
 
             # Dateiname zusammensetzen
@@ -445,136 +1123,134 @@ class AldiProspektScraper:
             filename = f"{base_filename}.pdf"
             filepath = os.path.join(self.output_dir, filename)
 
-            # Prüfen, ob wir das Prospekt bereits haben, basierend auf Typ, KW und Jahr
-            if not self.force_download:
-                # Suche nach Prospekten mit gleichem Typ, KW und Jahr
-                for stored_hash, stored_info in self.metadata["prospekte"].items():
-                    stored_info_type = stored_info.get("info", {}).get("typ", "")
-                    stored_info_kw = stored_info.get("info", {}).get("kalenderwoche", "")
-                    stored_info_year = stored_info.get("info", {}).get("jahr", "")
-                    stored_info_date = stored_info.get("info", {}).get("datum", "")
-
-                    # Wenn es sich um ein Wochenangebot handelt, prüfe KW und Jahr
-                    if (prospekt_info["typ"] == "Wochenangebot" and
-                        stored_info_type == "Wochenangebot" and
-                        prospekt_info["kalenderwoche"] == stored_info_kw and
-                        str(prospekt_info["jahr"]) == str(stored_info_year)):
-
-                        existing_file = stored_info["filepath"]
-                        if os.path.exists(existing_file):
-                            # Füge die neue URL zu den Metadaten hinzu
-                            self.metadata["prospekte"][url_hash] = stored_info
-                            self._save_metadata()
-                            logger.info(f"Wochenangebot für KW{prospekt_info['kalenderwoche']} {prospekt_info['jahr']} bereits vorhanden: {existing_file}")
-                            return existing_file
-
-                    # Wenn es sich um ein Reisemagazin oder Themenkatalog handelt, prüfe Datum und Jahr
-                    elif ((prospekt_info["typ"] == "Reisemagazin" or prospekt_info["typ"] == "Themenkatalog") and
-                          stored_info_type == prospekt_info["typ"] and
-                          prospekt_info["datum"] == stored_info_date and
-                          str(prospekt_info["jahr"]) == str(stored_info_year)):
-
-                        existing_file = stored_info["filepath"]
-                        if os.path.exists(existing_file):
-                            # Füge die neue URL zu den Metadaten hinzu
-                            self.metadata["prospekte"][url_hash] = stored_info
-                            self._save_metadata()
-                            logger.info(f"{prospekt_info['typ']} für {prospekt_info['datum']} {prospekt_info['jahr']} bereits vorhanden: {existing_file}")
-                            return existing_file
-
-                    # Wenn es sich um einen Inlineflyer handelt, prüfe KW und Jahr
-                    elif (prospekt_info["typ"] == "Inlineflyer" and
-                          stored_info_type == "Inlineflyer" and
-                          prospekt_info["kalenderwoche"] == stored_info_kw and
-                          str(prospekt_info["jahr"]) == str(stored_info_year)):
-
-                        existing_file = stored_info["filepath"]
-                        if os.path.exists(existing_file):
-                            # Füge die neue URL zu den Metadaten hinzu
-                            self.metadata["prospekte"][url_hash] = stored_info
-                            self._save_metadata()
-                            logger.info(f"Inlineflyer für KW{prospekt_info['kalenderwoche']} {prospekt_info['jahr']} bereits vorhanden: {existing_file}")
-                            return existing_file
-
-            # Prüfen, ob eine Datei mit diesem Namen bereits existiert
-            if os.path.exists(filepath) and not self.force_download:
-                # Prüfen, ob die Datei bereits in den Metadaten vorhanden ist
-                for stored_hash, stored_info in self.metadata["prospekte"].items():
-                    if stored_info["filepath"] == filepath:
+            with self._metadata_lock:
+                # Prüfen, ob eine Datei mit diesem Namen bereits existiert
+                adopt_existing = os.path.exists(filepath) and not replace_existing
+                if adopt_existing:
+                    # Prüfen, ob die Datei bereits in den Metadaten vorhanden ist
+                    stored_info = self._find_duplicate(None, filepath)
+                    if stored_info:
                         # Wenn die Datei bereits in den Metadaten ist, aber mit einer anderen URL,
                         # fügen wir die neue URL zu den Metadaten hinzu
-                        if stored_hash != url_hash:
-                            self.metadata["prospekte"][url_hash] = stored_info
+                        if self.metadata["prospekte"].get(url_hash) is not stored_info:
+                            self._store_record(url_hash, stored_info)
                             self._save_metadata()
+                        response.close()
                         logger.info(f"Prospekt bereits vorhanden: {filepath}")
                         return filepath
 
-                # Wenn die Datei existiert, aber nicht in den Metadaten ist,
-                # fügen wir sie zu den Metadaten hinzu
-                file_hash = self._get_file_hash(filepath)
-                self.metadata["prospekte"][url_hash] = {
-                    "url": url,
-                    "flyer_url": flyer_url,
-                    "title": title,
-                    "filename": filename,
-                    "filepath": filepath,
-                    "hash": file_hash,
-                    "downloaded_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    "info": prospekt_info
-                }
+                # Wenn die Datei bereits existiert, aber erneut heruntergeladen wird,
+                # erstellen wir einen eindeutigen Dateinamen mit Zeitstempel
+                if os.path.exists(filepath) and replace_existing:
+                    filename = self._unique_filename(base_filename, url_hash)
+                    filepath = os.path.join(self.output_dir, filename)
 
-                # Speichere auch den Datei-Hash für die Duplikaterkennung
-                if "file_hashes" not in self.metadata:
-                    self.metadata["file_hashes"] = {}
-                self.metadata["file_hashes"][file_hash] = url_hash
-
-                self._save_metadata()
+            if adopt_existing:
+                # Wenn die Datei existiert, aber nicht in den Metadaten ist, fügen wir sie zu den Metadaten hinzu;
+                # der Hash wird außerhalb der Sperre berechnet, damit andere Downloads nicht blockiert werden
+                response.close()
+                file_hash = self._get_file_hash(filepath)
+                with self._metadata_lock:
+                    # Ein paralleler Download kann die Datei inzwischen eingetragen haben
+                    stored_info = self._find_duplicate(None, filepath)
+                    if stored_info:
+                        self._store_record(url_hash, stored_info)
+                    else:
+                        self._store_record(url_hash, {
+                            "url": url,
+                            "flyer_url": flyer_url,
+                            "title": title,
+                            "filename": filename,
+                            "filepath": filepath,
+                            "hash": file_hash,
+                            "downloaded_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                            # Die vorhandene Datei wurde nicht mit der Antwort verglichen, daher keine Validatoren
+                            # speichern; sonst würde ein späteres HTTP 304 eine abweichende Datei bestätigen
+                            "etag": "",
+                            "last_modified": "",
+                            "info": prospekt_info
+                        })
+
+                        # Speichere auch den Datei-Hash für die Duplikaterkennung
+                        if "file_hashes" not in self.metadata:
+                            self.metadata["file_hashes"] = {}
+                        self.metadata["file_hashes"][file_hash] = url_hash
+
+                    self._save_metadata()
                 logger.info(f"Prospekt bereits vorhanden (Metadaten aktualisiert): {filepath}")
                 return filepath
 
-            # Wenn die Datei bereits existiert, aber force_download aktiviert ist,
-            # erstellen wir einen eindeutigen Dateinamen mit Zeitstempel
-            if os.path.exists(filepath) and self.force_download:
-                date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"{base_filename}_{date_str}.pdf"
-                filepath = os.path.join(self.output_dir, filename)
-
-            # PDF herunterladen
-            response = requests.get(url, stream=True)
-            if response.status_code == 200:
-                # Zuerst in eine temporäre Datei herunterladen
-                temp_filepath = filepath + ".tmp"
-                with open(temp_filepath, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-
-                # Hash der heruntergeladenen Datei berechnen
-                file_hash = self._get_file_hash(temp_filepath)
-
+            # PDF herunterladen, die Verbindung wird danach an den Pool der Session zurückgegeben
+            with response:
+                # Zuerst in eine temporäre Datei herunterladen; URL-Hash und Thread im Namen verhindern,
+                # dass sich parallele Downloads mit demselben Zieldateinamen gegenseitig überschreiben
+                temp_filepath = f"{filepath}.{url_hash}.{threading.get_ident()}.tmp"
+                # Rohdaten direkt in die Datei kopieren; gzip/deflate wird dabei transparent dekodiert
+                response.raw.decode_content = True
+                try:
+                    with open(temp_filepath, 'wb') as f:
+                        self._advise_sequential(f)
+                        self._preallocate(f, response)
+                        # Der Hash wird beim Schreiben berechnet, die Datei muss danach nicht erneut gelesen werden
+                        writer = _HashingWriter(f)
+                        shutil.copyfileobj(response.raw, writer, length=self.DOWNLOAD_CHUNK_SIZE)
+                        # Vorab reservierten, aber nicht beschriebenen Platz wieder freigeben
+                        f.truncate(f.tell())
+                except BaseException:
+                    # Abgebrochene Downloads hinterlassen sonst eine vorab in voller Größe reservierte Datei
+                    if os.path.exists(temp_filepath):
+                        os.remove(temp_filepath)
+                    raise
+
+            file_hash = writer.hexdigest()
+
+            with self._metadata_lock:
                 # Prüfen, ob wir bereits eine Datei mit diesem Hash haben
                 if "file_hashes" in self.metadata and file_hash in self.metadata["file_hashes"] and not self.force_download:
                     # Wir haben bereits eine identische Datei
                     existing_url_hash = self.metadata["file_hashes"][file_hash]
                     if existing_url_hash in self.metadata["prospekte"]:
                         existing_file = self.metadata["prospekte"][existing_url_hash]["filepath"]
-                        if os.path.exists(existing_file):
+                        if not os.path.exists(existing_file):
+                            self._forget_record(existing_url_hash)
+                        else:
                             # Lösche die temporäre Datei
                             os.remove(temp_filepath)
 
                             # Füge die neue URL zu den Metadaten hinzu
-                            self.metadata["prospekte"][url_hash] = self.metadata["prospekte"][existing_url_hash]
+                            existing_info = self.metadata["prospekte"][existing_url_hash]
+                            if revalidating:
+                                # Inhalt unverändert: aktuelle Validatoren übernehmen, damit der nächste Lauf HTTP 304 erhält
+                                existing_info = dict(
+                                    existing_info,
+                                    etag=response.headers.get("ETag", ""),
+                                    last_modified=response.headers.get("Last-Modified", "")
+                                )
+                            self._store_record(url_hash, existing_info)
                             self._save_metadata()
 
                             logger.info(f"Inhaltlich identischer Prospekt bereits vorhanden: {existing_file}")
                             return existing_file
 
-                # Umbenennen der temporären Datei zur endgültigen Datei
+                # Ein paralleler Download kann denselben Prospekt inzwischen gespeichert haben
+                if not replace_existing:
+                    stored_info = self._find_duplicate(dedup_key, filepath, url_hash)
+                    if stored_info:
+                        os.remove(temp_filepath)
+                        self._store_record(url_hash, stored_info)
+                        self._save_metadata()
+                        logger.info(f"Prospekt bereits parallel heruntergeladen: {stored_info['filepath']}")
+                        return stored_info["filepath"]
+
+                # Umbenennen der temporären Datei zur endgültigen Datei; wurde der Name inzwischen
+                # von einem anderen Download belegt, wird die vorhandene Datei nicht überschrieben
                 if os.path.exists(filepath):
-                    os.remove(filepath)
+                    filename = self._unique_filename(base_filename, url_hash)
+                    filepath = os.path.join(self.output_dir, filename)
                 os.rename(temp_filepath, filepath)
 
                 # Metadaten aktualisieren
-                self.metadata["prospekte"][url_hash] = {
+                self._store_record(url_hash, {
                     "url": url,
                     "flyer_url": flyer_url,
                     "title": title,
@@ -582,69 +1258,245 @@ class AldiProspektScraper:
                     "filepath": filepath,
                     "hash": file_hash,
                     "downloaded_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                    "etag": response.headers.get("ETag", ""),
+                    "last_modified": response.headers.get("Last-Modified", ""),
                     "info": prospekt_info
-                }
+                })
 
                 # Speichere auch den Datei-Hash für die Duplikaterkennung
                 if "file_hashes" not in self.metadata:
                     self.metadata["file_hashes"] = {}
                 self.metadata["file_hashes"][file_hash] = url_hash
+                if content_key:
+                    self.metadata["content_index"][content_key] = url_hash
 
                 self._save_metadata()
 
-                logger.info(f"Prospekt heruntergeladen nach {filepath}")
-                return filepath
-            else:
-                logger.error(f"PDF-Download fehlgeschlagen: HTTP {response.status_code}")
+            logger.info(f"Prospekt heruntergeladen nach {filepath}")
+            return filepath
         except Exception as e:
             logger.error(f"Fehler beim Herunterladen des PDFs: {str(e)}")
 
         return None
 
+    async def _new_context(self, browser, storage_state=None):
+        """
+        Erstellt einen Browser-Kontext, in dem Bilder, Stylesheets, Schriften und Medien blockiert werden.
+
+        Args:
+            browser: Playwright-Browserobjekt
+            storage_state (dict): Cookies und Local Storage, mit denen der Kontext vorbelegt wird
+        """
+        context = await browser.new_context(viewport={"width": 1280, "height": 800}, storage_state=storage_state)
+        await context.route("**/*", self._block_resources)
+        return context
+
+    def _resolve_pdf_url_without_browser(self, flyer_url):
+        """
+        PDF-URL ohne Browser ermitteln, über den Cache der Prospektseiten oder das statische HTML.
+
+        Args:
+            flyer_url (str): URL der Prospektseite
+
+        Returns:
+            tuple: (PDF-URL oder None, Dict mit 'etag' und 'last_modified' der Prospektseite)
+        """
+        # Innerhalb der TTL wird die bekannte PDF-URL ohne jede Anfrage verwendet
+        pdf_url, cached = self._check_flyer_cache(flyer_url)
+        if pdf_url:
+            logger.info(f"Prospektseite kürzlich ausgewertet, verwende bekannte PDF-URL: {flyer_url}")
+            return pdf_url, {}
+
+        # Schneller Weg: PDF-Verweis per bedingter Anfrage direkt aus dem statischen HTML lesen
+        return self._try_http_extract(flyer_url, cached)
+
+    async def _download(self, executor, previous, pdf_url, flyer):
+        """
+        PDF im Thread-Pool herunterladen, sobald ein vorheriger Download desselben Prospekts beendet ist.
+
+        Args:
+            executor (ThreadPoolExecutor): Thread-Pool für die PDF-Downloads
+            previous (asyncio.Future): Download mit demselben Duplikatschlüssel oder None
+            pdf_url (str): URL der PDF-Datei
+            flyer (dict): Prospekt mit 'url' und 'title'
+
+        Returns:
+            str: Pfad zur heruntergeladenen Datei oder None
+        """
+        if previous is not None:
+            # Danach erkennt download_pdf den bereits gespeicherten Prospekt über die Metadaten
+            await asyncio.gather(previous, return_exceptions=True)
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, self.download_pdf, pdf_url, flyer['title'], flyer['url']
+        )
+
+    async def _worker(self, browser, flyers, executor, downloads, pending, storage_state=None):
+        """
+        Prospekte aus der Warteschlange abarbeiten, bis sie leer ist.
+
+        Jeder Worker nutzt einen eigenen Browser-Kontext mit einer einzigen Seite, die für alle seine
+        Prospekte wiederverwendet wird. Beide werden erst bei der ersten Prospektseite angelegt,
+        die tatsächlich einen Browser benötigt. Die Downloads werden im Thread-Pool
+        gestartet, ohne auf ihr Ende zu warten, damit der Worker sofort den nächsten Prospekt bearbeiten kann.
+
+        Args:
+            browser: Playwright-Browserobjekt
+            flyers (asyncio.Queue): Warteschlange der zu verarbeitenden Prospekte
+            executor (ThreadPoolExecutor): Thread-Pool für die PDF-Downloads
+            downloads (list): Liste, an die (Prospekt, Download-Future)-Paare angehängt werden
+            pending (dict): Laufende Downloads nach PDF-URL und nach Duplikatschlüssel
+            storage_state (dict): Zustand der Übersichtsseite inklusive Cookie-Zustimmung
+        """
+        loop = asyncio.get_running_loop()
+        context = None
+        page = None
+        try:
+            while True:
+                try:
+                    flyer = flyers.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                try:
+                    pdf_url, validators = await loop.run_in_executor(
+                        None, self._resolve_pdf_url_without_browser, flyer['url']
+                    )
+
+                    if not pdf_url:
+                        # Der Browser wird nur genutzt, wenn das statische HTML keinen PDF-Verweis enthält
+                        if context is None:
+                            context = await self._new_context(browser, storage_state)
+                        # Eine abgestürzte oder geschlossene Seite wird ersetzt
+                        if page is None or page.is_closed():
+                            page = await context.new_page()
+                        pdf_url = await self.extract_pdf_url(page, flyer['url'])
+                        if pdf_url:
+                            self._remember_flyer(flyer['url'], pdf_url, validators)
+
+                    if not pdf_url:
+                        logger.warning(f"Keine PDF-URL für Prospekt gefunden: {flyer['title']}")
+                        continue
+
+                    logger.info(f"PDF-URL gefunden: {pdf_url}")
+                    # Mehrere Prospektseiten können auf dasselbe PDF verweisen: den laufenden Download weiterverwenden
+                    download = pending.get(pdf_url)
+                    if download is None:
+                        # Prospekte mit demselben Duplikatschlüssel nacheinander herunterladen, damit
+                        # z.B. ein Wochenangebot pro Kalenderwoche nur einmal gespeichert wird
+                        dedup_key = self._dedup_key(self._extract_prospekt_info(flyer['url'], flyer['title']))
+                        download = asyncio.ensure_future(
+                            self._download(executor, pending.get(dedup_key), pdf_url, flyer)
+                        )
+                        pending[pdf_url] = download
+                        if dedup_key:
+                            pending[dedup_key] = download
+                    downloads.append((flyer, download))
+                except Exception as e:
+                    # Ein fehlgeschlagener Prospekt bricht die übrigen nicht ab
+                    logger.warning(f"Fehler beim Verarbeiten des Prospekts {flyer['title']}: {str(e)}")
+        finally:
+            if context is not None:
+                await context.close()
+
     async def run(self):
         """Scraper ausführen, um alle Prospekte herunterzuladen."""
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=self.headless)
-            page = await browser.new_page()
+        self._date_str = datetime.now().strftime("%Y%m%d_%H%M%S")
+        browser = await _BrowserPool.acquire(self.headless)
+        try:
+            return await self._run_with_browser(browser)
+        finally:
+            # Erst danach darf der Pool den Browser neu starten oder schließen
+            await _BrowserPool.release(browser)
 
-            # Viewport-Größe setzen
-            await page.set_viewport_size({"width": 1920, "height": 1080})
+    async def _run_with_browser(self, browser):
+        """
+        Alle Prospekte mit einem Browser aus dem Pool verarbeiten.
 
-            try:
-                flyer_links = await self.get_flyer_links(page)
+        Args:
+            browser: Playwright-Browserobjekt
+
+        Returns:
+            list: Pfade der heruntergeladenen Prospekte
+        """
+        # Cookie-Zustimmung aus einem früheren Lauf wiederverwenden, das Banner erscheint dann nicht mehr
+        stored_state = self.storage_state_path if os.path.exists(self.storage_state_path) else None
+        try:
+            context = await self._new_context(browser, stored_state)
+        except Exception as e:
+            logger.warning(f"Gespeicherter Browser-Zustand konnte nicht geladen werden: {str(e)}")
+            stored_state = None
+            context = await self._new_context(browser)
 
-                if not flyer_links:
-                    logger.warning("Keine Prospekte gefunden")
-                    return []
+        try:
+            page = await context.new_page()
+            cookie_timeout = self.COOKIE_TIMEOUT_STORED if stored_state else self.COOKIE_TIMEOUT
+            flyer_links = await self.get_flyer_links(page, cookie_timeout, consent_stored=bool(stored_state))
+            # Die Cookie-Zustimmung wird an die Kontexte der Worker weitergegeben und für
+            # spätere Läufe gespeichert, damit das Banner nicht erneut erscheint
+            storage_state = await context.storage_state(path=self.storage_state_path)
+        finally:
+            # Nur den Kontext schließen, der Browser bleibt für weitere Läufe im Pool
+            await context.close()
+
+        if not flyer_links:
+            logger.warning("Keine Prospekte gefunden")
+            return []
 
-                downloaded_files = []
-                for flyer in flyer_links:
-                    pdf_url = await self.extract_pdf_url(page, flyer['url'])
-                    if pdf_url:
-                        logger.info(f"PDF-URL gefunden: {pdf_url}")
-                        filepath = self.download_pdf(pdf_url, flyer['title'], flyer['url'])
-                        if filepath:
-                            downloaded_files.append(filepath)
-                    else:
-                        logger.warning(f"Keine PDF-URL für Prospekt gefunden: {flyer['title']}")
+        flyers = asyncio.Queue()
+        for flyer in flyer_links:
+            flyers.put_nowait(flyer)
 
-                logger.info(f"{len(downloaded_files)} Prospekte heruntergeladen")
-                return downloaded_files
+        downloads = []
+        pending = {}
+        try:
+            # Eine feste Anzahl Worker verarbeitet die Prospektseiten gleichzeitig, Downloads laufen im Thread-Pool
+            with ThreadPoolExecutor(max_workers=self.MAX_DOWNLOAD_WORKERS) as executor:
+                await asyncio.gather(*(
+                    self._worker(browser, flyers, executor, downloads, pending, storage_state)
+                    for _ in range(min(self.concurrency, len(flyer_links)))
+                ))
+                results = await asyncio.gather(*(future for _, future in downloads), return_exceptions=True)
+        finally:
+            # Ausstehende Änderungen und den Cache der Prospektseiten auch speichern,
+            # wenn kein neuer Prospekt heruntergeladen wurde
+            self._save_metadata(force=True)
+
+        downloaded_files = []
+        for (flyer, _), result in zip(downloads, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Fehler beim Herunterladen des Prospekts {flyer['title']}: {str(result)}")
+            elif result and result not in downloaded_files:
+                downloaded_files.append(result)
+
+        logger.info(f"{len(downloaded_files)} Prospekte heruntergeladen")
+        return downloaded_files
 
-            finally:
-                await browser.close()
 
 async def main_async(args):
-    """Asynchrone Hauptfunktion zum Ausführen des Scrapers."""
+    """
+    Asynchrone Hauptfunktion zum Ausführen des Scrapers.
+
+    Returns:
+        list: Pfade der in diesem Lauf heruntergeladenen Prospekte
+    """
     logger.info(f"Starte Aldi Prospekt-Scraper mit Ausgabeverzeichnis: {args.output_dir}")
 
     scraper = AldiProspektScraper(
         output_dir=args.output_dir,
         headless=args.headless,
         force_download=args.force,
-        debug=args.debug
+        debug=args.debug,
+        concurrency=args.concurrency,
+        force_rescrape=args.force_rescrape,
+        revalidate=args.revalidate
     )
-    downloaded_files = await scraper.run()
+    if args.compact:
+        scraper.compact_metadata()
+
+    try:
+        downloaded_files = await scraper.run()
+    finally:
+        await _BrowserPool.close()
 
     if downloaded_files:
         logger.info("Prospekte erfolgreich heruntergeladen:")
@@ -653,6 +1505,18 @@ async def main_async(args):
     else:
         logger.warning("Es wurden keine Prospekte heruntergeladen")
 
+    return downloaded_files
+
+def _positive_int(value):
+    """Argumenttyp für argparse, der nur ganze Zahlen ab 1 zulässt."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Keine ganze Zahl: {value}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"Muss mindestens 1 sein: {value}")
+    return number
+
 def main():
     """Hauptfunktion zum Ausführen des Scrapers."""
     parser = argparse.ArgumentParser(description='Aldi Süd Prospekte mit Playwright scrapen und herunterladen')
@@ -662,8 +1526,16 @@ def main():
                         help='Browser im Headless-Modus ausführen')
     parser.add_argument('--force', action='store_true', default=False,
                         help='Prospekte erneut herunterladen, auch wenn sie bereits existieren')
+    parser.add_argument('--revalidate', action='store_true', default=False,
+                        help='Bekannte Prospekte beim Server auf Änderungen prüfen und nur geänderte erneut herunterladen')
     parser.add_argument('--debug', action='store_true', default=False,
                         help='Debug-Modus aktivieren (erstellt Screenshots bei Fehlern)')
+    parser.add_argument('--concurrency', type=_positive_int, default=None,
+                        help=f'Anzahl gleichzeitig verarbeiteter Prospektseiten (Standard: {AldiProspektScraper.MAX_CONCURRENT_PAGES})')
+    parser.add_argument('--compact', action='store_true', default=False,
+                        help='Metadaten-Einträge für nicht mehr vorhandene Dateien vor dem Scrapen entfernen')
+    parser.add_argument('--force-rescrape', action='store_true', default=False,
+                        help='Prospektseiten erneut auswerten, auch wenn ihre PDF-URL bereits bekannt ist')
 
     args = parser.parse_args()
 